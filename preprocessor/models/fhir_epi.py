@@ -6,6 +6,10 @@ Represents a FHIR Bundle containing an electronic Product Information document
 """
 
 import typing
+from pathlib import Path
+
+import orjson
+
 from preprocessor.models.base_model import Model
 
 
@@ -95,29 +99,36 @@ class FhirEPI(Model):
         
         return instance
 
+    @classmethod
+    def from_file(cls, path: typing.Union[str, Path]) -> 'FhirEPI':
+        """Create a FhirEPI instance from a JSON file on disk
+
+        :param path: Path to a FHIR Bundle JSON file
+        :return: FhirEPI instance
+        """
+        return cls.from_dict(orjson.loads(Path(path).read_bytes()))
+
     def to_dict(self) -> dict:
         """Convert the FhirEPI instance to a dictionary
         
         :return: Dictionary representation of the ePI
         """
-        result = {}
-        
-        if self.resource_type is not None:
-            result['resourceType'] = self.resource_type
-        if self.type is not None:
-            result['type'] = self.type
-        if self.timestamp is not None:
-            result['timestamp'] = self.timestamp
-        if self.entry is not None and len(self.entry) > 0:
-            result['entry'] = self.entry
-        if self.meta is not None:
-            result['meta'] = self.meta
-        if self.identifier is not None:
-            result['identifier'] = self.identifier
-        if self.signature is not None:
-            result['signature'] = self.signature
-        
-        return result
+        return {
+            key: value
+            for attr, key in self.attribute_map.items()
+            if self._included(value := getattr(self, attr))
+        }
+
+    @staticmethod
+    def _included(value) -> bool:
+        """Check whether an attribute value is serialized by to_dict
+        
+        None values and empty lists (e.g. a bundle without entries) are omitted.
+        
+        :param value: Attribute value
+        :return: True if the value should be included
+        """
+        return value is not None and value != []
 
     def __repr__(self) -> str:
         """Return string representation of FhirEPI"""
@@ -130,18 +141,17 @@ class FhirEPI(Model):
     def get_composition(self) -> dict:
         """Get the Composition resource from the bundle
         
-        The first entry is typically the Composition resource in a document bundle.
+        The first entry is typically the Composition resource in a document bundle;
+        the first Composition found in the bundle is returned.
         
         :return: Composition resource dict or None
         """
-        if not self.entry or len(self.entry) == 0:
+        if not self.entry:
             return None
         
-        first_entry = self.entry[0]
-        if isinstance(first_entry, dict) and 'resource' in first_entry:
-            resource = first_entry['resource']
-            if isinstance(resource, dict) and resource.get('resourceType') == 'Composition':
-                return resource
+        for entry in self.entry:
+            if self._resource_type_of(entry) == 'Composition':
+                return entry['resource']
         
         return None
 
@@ -151,33 +161,73 @@ class FhirEPI(Model):
         :param resource_type: The FHIR resourceType to filter by
         :return: List of entries matching the resource type
         """
-        matching = []
-        for entry in self.entry:
-            if isinstance(entry, dict) and 'resource' in entry:
-                resource = entry['resource']
-                if isinstance(resource, dict) and resource.get('resourceType') == resource_type:
-                    matching.append(entry)
+        if not self.entry:
+            return []
+        
+        resource_type_of = self._resource_type_of
+        return [entry for entry in self.entry if resource_type_of(entry) == resource_type]
+
+    @staticmethod
+    def _resource_type_of(entry) -> typing.Optional[str]:
+        """Get the resourceType of a bundle entry's resource
         
-        return matching
+        :param entry: Bundle entry
+        :return: The resourceType, or None for malformed entries
+        """
+        try:
+            return entry['resource']['resourceType']
+        except (KeyError, TypeError):
+            return None
 
-    def get_all_html_content(self) -> dict:
+    def get_all_html_content(
+        self,
+        include_stats: bool = False,
+        include_columns: bool = False,
+        include_index: bool = False
+    ) -> dict:
         """Get all HTML content from the composition (including nested sections)
         
         Extracts HTML from:
         - composition.text.div (main composition HTML)
         - All sections and their nested subsections recursively
         
+        The result is built from the current composition on every call, so it
+        reflects changes made through update_section() as well as through the
+        html_content_manager and html_element_link_manager functions.
+        
+        :param include_stats: Add 'stats' aggregated over all sections
+        :param include_columns: Add 'sections_columns' with the sections as parallel lists
+        :param include_index: Add 'by_title' mapping section titles to section dicts
         :return: Dictionary with comprehensive HTML content
         """
         from preprocessor.models.html_content_manager import get_all_html_content
         
+        return get_all_html_content(
+            self.get_composition() or {},
+            include_stats=include_stats,
+            include_columns=include_columns,
+            include_index=include_index
+        )
+
+    def update_section(self, section_title: str, new_html: str, recursive: bool = True) -> bool:
+        """Update the HTML of a composition section by title
+        
+        The section is looked up in the composition's current section tree.
+        
+        :param section_title: Title of the section to update
+        :param new_html: New HTML content
+        :param recursive: Whether to search in nested subsections
+        :return: True if the section was found and updated, False otherwise
+        """
+        from preprocessor.models.html_content_manager import update_section_html
+        
         composition = self.get_composition()
         if not composition:
-            return {
-                'composition_html': '',
-                'sections': [],
-                'total_sections': 0,
-                'max_nesting_level': 0
-            }
-        
-        return get_all_html_content(composition)
+            return False
+        
+        return update_section_html(
+            composition.get('section', []),
+            section_title,
+            new_html,
+            recursive=recursive
+        )
@@ -10,9 +10,41 @@ The HTML content is typically stored in:
 It contains XHTML markup representing the rendered ePI document.
 """
 
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from array import array
+from html import unescape
 from html.parser import HTMLParser
+from collections import Counter
+from functools import lru_cache
 import re
+import sys
+
+
+# Static patterns, compiled once at import
+_STRIP_TAGS_RE = re.compile(r'<[^>]+>')
+_START_TAG_RE = re.compile(r'<(\w+)\b((?:[^<>"\']|"[^"]*"|\'[^\']*\')*)(>)?')
+_WORD_RE = re.compile(r'\w+')
+_CLASS_ATTR_RE = re.compile(r'class=["\']([^"\']+)["\']')
+_OPEN_TAG_RE = re.compile(r'<(\w+)\b[^>]*(?<!/)>')
+_CLOSE_TAG_RE = re.compile(r'</(\w+)>')
+
+# Void elements, which have no closing tag
+_VOID_TAGS = frozenset({
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'source', 'track', 'wbr'
+})
+
+# Structural markers counted per section by get_all_html_content
+_STRUCTURE_MARKER_RE = re.compile(r'<ul>|<ol>|<table>|<a ')
+
+# Structural tags searched by extract_html_sections: (opening tag, closing tag)
+_SECTION_TAG_PATTERNS = {
+    tag: (
+        re.compile(rf'<{tag}\b[^>]*class=["\']([^"\']*)["\']([^>]*)>'),
+        re.compile(rf'</{tag}>')
+    )
+    for tag in ('section', 'article', 'div', 'main')
+}
 
 
 class HtmlContent:
@@ -24,6 +56,8 @@ class HtmlContent:
         parsed (bool): Whether content has been parsed
     """
     
+    __slots__ = ('raw_html', 'parsed')
+    
     def __init__(self, raw_html: str = ""):
         """Initialize with raw HTML content"""
         self.raw_html = raw_html
@@ -73,6 +107,8 @@ class HtmlSection:
         content (str): The HTML content of this section
     """
     
+    __slots__ = ('tag_name', 'start_pos', 'end_pos', 'class_name', 'id_attr', 'content')
+    
     def __init__(
         self,
         tag_name: str,
@@ -113,6 +149,8 @@ class HtmlElement:
         attributes (Dict[str, str]): Other attributes
     """
     
+    __slots__ = ('tag', 'text_content', 'class_names', 'id', 'position', 'attributes')
+    
     def __init__(
         self,
         tag: str,
@@ -156,16 +194,47 @@ def get_html_content(composition: Dict[str, Any]) -> HtmlContent:
     return HtmlContent.from_composition(composition)
 
 
+def _new_html_stats() -> Dict[str, int]:
+    """Create empty section statistics accumulators"""
+    return {
+        'total_html_length': 0,
+        'sections_with_lists': 0,
+        'sections_with_tables': 0,
+        'sections_with_links': 0
+    }
+
+
+def _accumulate_html_stats(stats: Dict[str, int], html: str) -> None:
+    """Add one section's HTML to the statistics accumulators"""
+    found = set(_STRUCTURE_MARKER_RE.findall(html))
+    stats['total_html_length'] += len(html)
+    if '<ul>' in found or '<ol>' in found:
+        stats['sections_with_lists'] += 1
+    if '<table>' in found:
+        stats['sections_with_tables'] += 1
+    if '<a ' in found:
+        stats['sections_with_links'] += 1
+
+
 def extract_all_html_from_sections(
     sections: List[Dict[str, Any]],
-    results: Optional[List[Dict[str, Any]]] = None
+    results: Optional[List[Dict[str, Any]]] = None,
+    section_index: Optional[Dict[str, Dict[str, Any]]] = None,
+    stats: Optional[Dict[str, int]] = None
 ) -> List[Dict[str, Any]]:
     """
-    Recursively extract HTML content from all sections and subsections
+    Extract HTML content from all sections and nested subsections
+    
+    Sections are returned in document order (each section followed by its
+    subsections).
     
     Args:
         sections: List of section dictionaries from a Composition
-        results: Accumulator for recursive calls (leave as None for initial call)
+        results: Optional list to append the section entries to
+        section_index: Optional dictionary filled with title -> section dictionary
+            (the first section wins when titles repeat)
+        stats: Optional statistics dictionary (see get_all_html_content) to add
+            the extracted sections to; missing counters start at 0
     
     Returns:
         List of dictionaries containing section metadata and HTML content:
@@ -183,47 +252,85 @@ def extract_all_html_from_sections(
     if results is None:
         results = []
     
-    if not sections or not isinstance(sections, list):
-        return results
+    _collect_sections(sections, results, section_index, stats)
+    return results
+
+
+def _walk_sections(
+    sections: List[Dict[str, Any]],
+    level: int = 0
+) -> Iterator[Dict[str, Any]]:
+    """
+    Walk the section tree depth-first, recursing into subsections
     
+    Lazily yields one entry per section in document order (see
+    extract_all_html_from_sections).
+    """
     for section in sections:
         if not isinstance(section, dict):
             continue
         
-        # Extract section metadata
-        section_info = {
+        # One lookup per key, HTML taken from text.div
+        text = section.get('text')
+        subsections = section.get('section')
+        has_subsections = isinstance(subsections, list)
+        
+        yield {
             'title': section.get('title', ''),
             'code': section.get('code'),
-            'html': '',
-            'level': 0,
-            'has_subsections': False
+            'html': text.get('div', '') if isinstance(text, dict) else '',
+            'level': level,
+            'has_subsections': has_subsections
         }
         
-        # Extract HTML from text.div
-        if 'text' in section and isinstance(section['text'], dict):
-            section_info['html'] = section['text'].get('div', '')
-        
-        # Check for subsections
-        if 'section' in section and isinstance(section['section'], list):
-            section_info['has_subsections'] = True
-        
-        results.append(section_info)
-        
-        # Recursively process subsections
-        if section_info['has_subsections']:
-            subsection_results = extract_all_html_from_sections(
-                section['section'],
-                []
-            )
-            # Update level for subsections
-            for subsection in subsection_results:
-                subsection['level'] = section_info['level'] + 1
-            results.extend(subsection_results)
+        # Subsections follow their parent directly, one level deeper
+        if has_subsections:
+            yield from _walk_sections(subsections, level + 1)
+
+
+def _collect_sections(
+    sections: List[Dict[str, Any]],
+    results: List[Dict[str, Any]],
+    section_index: Optional[Dict[str, Dict[str, Any]]],
+    stats: Optional[Dict[str, int]],
+    columns: Optional[Dict[str, List[Any]]] = None
+) -> None:
+    """
+    Collect every section of the tree into results and the accumulators
     
-    return results
+    Appends one entry per section to results (see
+    extract_all_html_from_sections) and fills the optional accumulators
+    from those entries.
+    """
+    if not sections or not isinstance(sections, list):
+        return
+    
+    start = len(results)
+    results.extend(_walk_sections(sections))
+    added = results[start:] if start else results
+    
+    if columns is not None:
+        columns['level'].extend([section_info['level'] for section_info in added])
+        columns['title'].extend([section_info['title'] for section_info in added])
+        columns['html'].extend([section_info['html'] for section_info in added])
+    
+    if section_index is not None:
+        for title, section in build_section_index(sections).items():
+            section_index.setdefault(title, section)
+    
+    if stats is not None:
+        for key, value in _new_html_stats().items():
+            stats.setdefault(key, value)
+        for section_info in added:
+            _accumulate_html_stats(stats, section_info['html'])
 
 
-def get_all_html_content(composition: Dict[str, Any]) -> Dict[str, Any]:
+def get_all_html_content(
+    composition: Dict[str, Any],
+    include_stats: bool = False,
+    include_columns: bool = False,
+    include_index: bool = False
+) -> Dict[str, Any]:
     """
     Extract all HTML content from Composition including nested sections
     
@@ -231,8 +338,15 @@ def get_all_html_content(composition: Dict[str, Any]) -> Dict[str, Any]:
     - composition.text.div (main composition HTML)
     - All sections and their nested subsections
     
+    Statistics, section columns and the title index are only computed when
+    requested: the columns and statistics from the extracted section
+    entries, the title index with build_section_index().
+    
     Args:
         composition: Composition resource dictionary
+        include_stats: Add 'stats' aggregated over all sections
+        include_columns: Add 'sections_columns' with the sections as parallel lists
+        include_index: Add 'by_title' mapping section titles to section dictionaries
     
     Returns:
         Dictionary with comprehensive HTML content:
@@ -248,6 +362,21 @@ def get_all_html_content(composition: Dict[str, Any]) -> Dict[str, Any]:
                 },
                 ...
             ],
+            'sections_columns': {  # include_columns only
+                'level': [0, 1, ...],
+                'title': ['Section Title', ...],
+                'html': ['<div>...</div>', ...]
+            },
+            'by_title': {  # include_index only; first section wins per title
+                'Section Title': {...},
+                ...
+            },
+            'stats': {  # include_stats only
+                'total_html_length': 18976,
+                'sections_with_lists': 6,
+                'sections_with_tables': 0,
+                'sections_with_links': 1
+            },
             'total_sections': 10,
             'max_nesting_level': 2
         }
@@ -258,25 +387,57 @@ def get_all_html_content(composition: Dict[str, Any]) -> Dict[str, Any]:
         'total_sections': 0,
         'max_nesting_level': 0
     }
+    if include_columns:
+        result['sections_columns'] = {'level': [], 'title': [], 'html': []}
+    if include_index:
+        result['by_title'] = {}
+    if include_stats:
+        result['stats'] = _new_html_stats()
     
     # Extract main composition HTML
     if 'text' in composition and isinstance(composition['text'], dict):
         result['composition_html'] = composition['text'].get('div', '')
     
-    # Extract all section HTML recursively
+    # Extract all section HTML, including nested subsections
     if 'section' in composition and isinstance(composition['section'], list):
-        result['sections'] = extract_all_html_from_sections(composition['section'])
-        result['total_sections'] = len(result['sections'])
+        sections = result['sections']
+        _collect_sections(
+            composition['section'],
+            sections,
+            result.get('by_title'),
+            result.get('stats'),
+            result.get('sections_columns')
+        )
+        result['total_sections'] = len(sections)
         
         # Calculate max nesting level
-        if result['sections']:
-            result['max_nesting_level'] = max(
-                section['level'] for section in result['sections']
-            )
+        if sections:
+            result['max_nesting_level'] = max(section['level'] for section in sections)
     
     return result
 
 
+def iter_all_html_content(composition: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yield the HTML of all sections and nested subsections
+    
+    Yields the same section entries as get_all_html_content()['sections'],
+    in document order, one at a time, without building the full list. Use
+    this when sections are processed in a single pass.
+    
+    Args:
+        composition: Composition resource dictionary
+    
+    Yields:
+        Dictionaries with 'title', 'html', 'code', 'level' and 'has_subsections'
+    """
+    sections = composition.get('section')
+    if not sections or not isinstance(sections, list):
+        return
+    
+    yield from _walk_sections(sections)
+
+
 def update_html_content(
     composition: Dict[str, Any],
     new_content: str
@@ -304,11 +465,43 @@ def update_html_content(
     return True
 
 
+def build_section_index(sections: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Build a title -> section lookup over all sections and nested subsections
+    
+    Build the index once and pass it to update_section_html() when updating
+    several sections of the same composition. When titles repeat, the first
+    section in document order wins (the one update_section_html would update).
+    
+    Args:
+        sections: List of section dictionaries
+    
+    Returns:
+        Dictionary mapping section title to the section dictionary
+    """
+    index = {}
+    if not sections or not isinstance(sections, list):
+        return index
+    
+    stack = list(reversed(sections))
+    while stack:
+        section = stack.pop()
+        if not isinstance(section, dict):
+            continue
+        if 'title' in section:
+            index.setdefault(section['title'], section)
+        if 'section' in section and isinstance(section['section'], list):
+            stack.extend(reversed(section['section']))
+    
+    return index
+
+
 def update_section_html(
     sections: List[Dict[str, Any]],
     section_title: str,
     new_html: str,
-    recursive: bool = True
+    recursive: bool = True,
+    section_index: Optional[Dict[str, Dict[str, Any]]] = None
 ) -> bool:
     """
     Update HTML content in a specific section by title (recursively searches subsections)
@@ -318,37 +511,59 @@ def update_section_html(
         section_title: Title of the section to update
         new_html: New HTML content
         recursive: Whether to search in nested subsections (default: True)
+        section_index: Optional index from build_section_index(); recursive
+            updates then look the section up instead of searching the tree
     
     Returns:
         True if section was found and updated, False otherwise
     """
-    if not sections or not isinstance(sections, list):
+    if recursive and section_index is not None:
+        target = section_index.get(section_title)
+    else:
+        target = _find_section(sections, section_title, recursive)
+    
+    if target is None:
         return False
     
-    for section in sections:
+    if 'text' not in target:
+        target['text'] = {}
+    target['text']['div'] = new_html
+    return True
+
+
+def _find_section(
+    sections: List[Dict[str, Any]],
+    section_title: str,
+    recursive: bool
+) -> Optional[Dict[str, Any]]:
+    """Find the first section with the given title in document order"""
+    if not sections or not isinstance(sections, list):
+        return None
+    
+    stack = list(reversed(sections))
+    while stack:
+        section = stack.pop()
         if not isinstance(section, dict):
             continue
         
         # Check if this is the target section
         if section.get('title') == section_title:
-            if 'text' not in section:
-                section['text'] = {}
-            section['text']['div'] = new_html
-            return True
+            return section
         
-        # Recursively search subsections
+        # Search subsections before the following siblings
         if recursive and 'section' in section and isinstance(section['section'], list):
-            if update_section_html(section['section'], section_title, new_html, recursive):
-                return True
+            stack.extend(reversed(section['section']))
     
-    return False
+    return None
 
 
+@lru_cache(maxsize=256)
 def extract_text_content(html_content: str) -> str:
     """
     Extract plain text from HTML content
     
-    Removes all HTML tags and returns clean text.
+    Removes all HTML tags and returns clean text. Results are memoized per
+    input string; see clear_html_cache().
     
     Args:
         html_content: HTML string
@@ -357,16 +572,152 @@ def extract_text_content(html_content: str) -> str:
         Plain text content
     """
     # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', html_content)
-    # Decode HTML entities
-    text = text.replace('&lt;', '<')
-    text = text.replace('&gt;', '>')
-    text = text.replace('&amp;', '&')
-    text = text.replace('&quot;', '"')
-    text = text.replace('&apos;', "'")
-    # Clean whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
-    return text
+    text = _STRIP_TAGS_RE.sub('', html_content)
+    # Decode HTML entities (named and numeric)
+    text = unescape(text)
+    # Clean whitespace (str.split() splits on the same characters as \s)
+    return ' '.join(text.split())
+
+
+def clear_html_cache() -> None:
+    """
+    Clear memoized results of the HTML extraction functions
+    
+    Results are keyed on the (immutable) HTML string, so clearing is only
+    needed to release memory.
+    """
+    extract_text_content.cache_clear()
+    _scan_start_tags.cache_clear()
+
+
+@lru_cache(maxsize=64)
+def _scan_start_tags(html_content: str) -> Tuple[re.Match, ...]:
+    """
+    Scan all start tags of an HTML string in one pass (memoized per string)
+    
+    Returns:
+        Matches of _START_TAG_RE in document order: group 1 is the tag name,
+        group 2 the attribute text and group 3 the closing '>' (None for a
+        tag that is cut off by the end of the string or by a stray '<', so
+        that e.g. 'x<y<br/>' still yields the br tag); quoted attribute
+        values may contain '<' and '>'
+    """
+    return tuple(_START_TAG_RE.finditer(html_content))
+
+
+def _class_values(attrs: str) -> List[str]:
+    """Get the values of the class attributes in a start tag's attribute text"""
+    if 'class=' not in attrs:
+        return []
+    return [match.group(1) for match in _CLASS_ATTR_RE.finditer(attrs)]
+
+
+def collect_elements(html_content: str) -> List[HtmlElement]:
+    """
+    Collect every element start tag in HTML content
+    
+    The underlying scan is shared (and memoized) with find_elements_by_tag,
+    find_elements_by_class and get_html_structure_summary, so calling several
+    of them on the same HTML only scans it once.
+    
+    A '<' followed by a name but no '>' before the next '<' (e.g. the 'y'
+    in 'x<y<br/>') is not an element; the tag after it is still found.
+    Quoted attribute values are skipped, so a '<' inside one (e.g.
+    title="a<b") does not end the tag.
+    
+    Args:
+        html_content: HTML string
+    
+    Returns:
+        List of HtmlElement instances (tag, classes and position) in document order
+    """
+    return [
+        HtmlElement(
+            tag=match.group(1),
+            class_names=' '.join(_class_values(match.group(2))).split(),
+            position=match.span()
+        )
+        for match in _scan_start_tags(html_content)
+        if match.group(3)
+    ]
+
+
+@lru_cache(maxsize=256)
+def _tag_pattern(tag_name: str) -> re.Pattern:
+    """Compile (once per tag name) the pattern used by find_elements_by_tag"""
+    return re.compile(rf'<{tag_name}\b[^>]*>')
+
+
+def find_elements_soa(html_content: str) -> Dict[str, Any]:
+    """
+    Collect every element start tag as parallel columns
+    
+    Same elements as collect_elements(), laid out column-wise for counting
+    and filtering without creating an HtmlElement per tag.
+    
+    Args:
+        html_content: HTML string
+    
+    Returns:
+        Dictionary of equally long columns:
+        {
+            'tag': ['div', 'p', ...],             # interned tag names
+            'start': array('l', [0, 22, ...]),    # start offsets in html_content
+            'end': array('l', [22, 25, ...]),     # end offsets in html_content
+            'class_names': [['box'], [], ...]
+        }
+    
+    Example:
+        cols = find_elements_soa(html)
+        p_starts = [s for t, s in zip(cols['tag'], cols['start']) if t == 'p']
+    """
+    tags = []
+    starts = array('l')
+    ends = array('l')
+    class_names = []
+    
+    for match in _scan_start_tags(html_content):
+        if not match.group(3):
+            continue
+        start, end = match.span()
+        tags.append(sys.intern(match.group(1)))
+        starts.append(start)
+        ends.append(end)
+        class_names.append(' '.join(_class_values(match.group(2))).split())
+    
+    return {
+        'tag': tags,
+        'start': starts,
+        'end': ends,
+        'class_names': class_names
+    }
+
+
+def iter_elements_by_class(
+    html_content: str,
+    class_name: str
+) -> Iterator[HtmlElement]:
+    """
+    Lazily yield HTML elements with a specific class
+    
+    Args:
+        html_content: HTML string
+        class_name: CSS class name to search for
+    
+    Yields:
+        HtmlElement instances in document order
+    """
+    for match in _scan_start_tags(html_content):
+        if not match.group(3):
+            continue
+        for classes_str in _class_values(match.group(2)):
+            if class_name in classes_str:
+                yield HtmlElement(
+                    tag=match.group(1),
+                    class_names=classes_str.split(),
+                    position=match.span()
+                )
+                break
 
 
 def find_elements_by_class(
@@ -383,24 +734,32 @@ def find_elements_by_class(
     Returns:
         List of HtmlElement instances
     """
-    elements = []
+    return list(iter_elements_by_class(html_content, class_name))
+
+
+def iter_elements_by_tag(
+    html_content: str,
+    tag_name: str
+) -> Iterator[HtmlElement]:
+    """
+    Lazily yield elements with a specific tag name
     
-    # Pattern to find class attributes
-    pattern = rf'<(\w+)[^>]*class=["\']([^"\']*{class_name}[^"\']*)["\']([^>]*)>'
+    Args:
+        html_content: HTML string
+        tag_name: Tag name (e.g., 'div', 'p', 'h1')
     
-    for match in re.finditer(pattern, html_content):
-        tag = match.group(1)
-        classes_str = match.group(2)
-        classes = classes_str.split()
-        
-        element = HtmlElement(
-            tag=tag,
-            class_names=classes,
-            position=(match.start(), match.end())
-        )
-        elements.append(element)
+    Yields:
+        HtmlElement instances in document order
+    """
+    if not _WORD_RE.fullmatch(tag_name):
+        # Names the start-tag scan cannot produce (e.g. 'my-element')
+        for match in _tag_pattern(tag_name).finditer(html_content):
+            yield HtmlElement(tag=tag_name, position=match.span())
+        return
     
-    return elements
+    for match in _scan_start_tags(html_content):
+        if match.group(1) == tag_name and match.group(3):
+            yield HtmlElement(tag=tag_name, position=match.span())
 
 
 def find_elements_by_tag(
@@ -417,19 +776,7 @@ def find_elements_by_tag(
     Returns:
         List of HtmlElement instances
     """
-    elements = []
-    
-    # Pattern to find opening tags
-    pattern = rf'<{tag_name}\b[^>]*>'
-    
-    for match in re.finditer(pattern, html_content):
-        element = HtmlElement(
-            tag=tag_name,
-            position=(match.start(), match.end())
-        )
-        elements.append(element)
-    
-    return elements
+    return list(iter_elements_by_tag(html_content, tag_name))
 
 
 def replace_html_section(
@@ -454,14 +801,15 @@ def replace_html_section(
         ValueError: If markers not found
     """
     start_pos = html_content.find(start_marker)
-    end_pos = html_content.find(end_marker)
-    
     if start_pos == -1:
         raise ValueError(f"Start marker not found: {start_marker}")
+    
+    # Continue from the start marker so the content is only scanned once
+    end_pos = html_content.find(end_marker, start_pos)
     if end_pos == -1:
+        if end_marker in html_content:
+            raise ValueError("Start marker comes after end marker")
         raise ValueError(f"End marker not found: {end_marker}")
-    if start_pos > end_pos:
-        raise ValueError("Start marker comes after end marker")
     
     # Keep the markers themselves if they are element tags
     if start_marker.startswith('<'):
@@ -492,20 +840,15 @@ def extract_html_sections(html_content: str) -> List[HtmlSection]:
     sections = []
     
     # Find major structural tags
-    tags_to_find = ['section', 'article', 'div', 'main']
-    
-    for tag in tags_to_find:
-        pattern = rf'<{tag}\b[^>]*class=["\']([^"\']*)["\']([^>]*)>'
-        
-        for match in re.finditer(pattern, html_content):
+    for tag, (open_pattern, close_pattern) in _SECTION_TAG_PATTERNS.items():
+        for match in open_pattern.finditer(html_content):
             class_attr = match.group(1)
             start_pos = match.start()
             
             # Find closing tag
-            close_pattern = rf'</{tag}>'
-            close_match = re.search(close_pattern, html_content[start_pos:])
+            close_match = close_pattern.search(html_content, start_pos)
             if close_match:
-                end_pos = start_pos + close_match.end()
+                end_pos = close_match.end()
                 section = HtmlSection(
                     tag_name=tag,
                     start_pos=start_pos,
@@ -551,19 +894,20 @@ def wrap_content_with_element(
     if not tag_name or not isinstance(tag_name, str):
         raise ValueError("tag_name must be a non-empty string")
     
-    # Build opening tag
     attrs = attributes or {}
-    if class_names:
-        attrs["class"] = " ".join(class_names)
+    class_str = " ".join(class_names) if class_names else None
     
-    # Build attribute string
-    attr_parts = []
+    # Build the whole element in one list and join once
+    parts = ['<', tag_name]
     for key, value in attrs.items():
-        attr_parts.append(f'{key}="{value}"')
-    
-    attr_str = " " + " ".join(attr_parts) if attr_parts else ""
+        if key == "class" and class_str is not None:
+            value = class_str
+        parts += (' ', key, '="', str(value), '"')
+    if class_str is not None and "class" not in attrs:
+        parts += (' class="', class_str, '"')
+    parts += ('>', content, '</', tag_name, '>')
     
-    return f"<{tag_name}{attr_str}>{content}</{tag_name}>"
+    return ''.join(parts)
 
 
 def get_html_structure_summary(html_content: str) -> Dict[str, Any]:
@@ -586,27 +930,23 @@ def get_html_structure_summary(html_content: str) -> Dict[str, Any]:
         "text_length": 0
     }
     
-    # Count tags
-    tag_pattern = r'<(\w+)\b'
-    for match in re.finditer(tag_pattern, html_content):
-        tag = match.group(1).lower()
-        summary["tag_counts"][tag] = summary["tag_counts"].get(tag, 0) + 1
+    # Count tags and their classes in a single pass over the start tags
+    tag_counts = Counter()
+    class_counts = Counter()
+    for match in _scan_start_tags(html_content):
+        tag_counts[match.group(1).lower()] += 1
+        for classes_str in _class_values(match.group(2)):
+            class_counts.update(classes_str.split())
+    summary["tag_counts"] = dict(tag_counts)
+    summary["class_counts"] = dict(class_counts)
     
     # Check for specific elements
-    summary["has_tables"] = bool(re.search(r'<table', html_content))
-    summary["has_forms"] = bool(re.search(r'<form', html_content))
-    summary["has_lists"] = bool(re.search(r'<[ou]l', html_content))
-    
-    # Extract text
-    text = extract_text_content(html_content)
-    summary["text_length"] = len(text)
+    summary["has_tables"] = '<table' in html_content
+    summary["has_forms"] = '<form' in html_content
+    summary["has_lists"] = '<ul' in html_content or '<ol' in html_content
     
-    # Count classes
-    class_pattern = r'class=["\']([^"\']+)["\']'
-    for match in re.finditer(class_pattern, html_content):
-        classes = match.group(1).split()
-        for cls in classes:
-            summary["class_counts"][cls] = summary["class_counts"].get(cls, 0) + 1
+    # Extract text (memoized, shared with other callers)
+    summary["text_length"] = len(extract_text_content(html_content))
     
     return summary
 
@@ -627,13 +967,18 @@ def validate_html_content(html_content: str) -> Tuple[bool, List[str]]:
         issues.append("Content is empty")
     
     # Check for unclosed tags
-    open_tags = re.findall(r'<(\w+)\b[^>]*(?<!/)>', html_content)
-    close_tags = re.findall(r'</(\w+)>', html_content)
+    open_tags = _OPEN_TAG_RE.findall(html_content)
+    close_tags = _CLOSE_TAG_RE.findall(html_content)
     
-    for tag in open_tags:
-        if tag.lower() not in ['br', 'hr', 'img', 'input', 'meta', 'link']:
-            if tag not in close_tags:
-                issues.append(f"Unclosed tag: {tag}")
+    close_set = set(close_tags)
+    
+    # Classify each distinct tag name once; report every occurrence in order
+    unclosed = {
+        tag for tag in set(open_tags)
+        if tag.lower() not in _VOID_TAGS and tag not in close_set
+    }
+    if unclosed:
+        issues.extend(f"Unclosed tag: {tag}" for tag in open_tags if tag in unclosed)
     
     # Check for invalid characters
     if '\x00' in html_content:
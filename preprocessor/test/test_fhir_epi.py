@@ -4,6 +4,7 @@ Unit tests for the preprocess controller and FHIR ePI model
 
 import unittest
 import json
+from pathlib import Path
 from preprocessor.models.fhir_epi import FhirEPI
 from preprocessor.controllers.preprocess_controller import preprocess_post
 
@@ -92,6 +93,27 @@ class TestFhirEPI(unittest.TestCase):
         self.assertEqual(len(medications), 1)
         self.assertEqual(medications[0]["resource"]["resourceType"], "Medication")
     
+    def test_fhir_epi_resource_type_lookups_track_entries(self):
+        """Test type lookups reflect entries added or replaced after a previous lookup"""
+        epi = FhirEPI.from_dict(self.sample_bundle)
+        self.assertEqual(epi.get_entries_by_resource_type("Organization"), [])
+        
+        epi.entry.append({"resource": {"resourceType": "Organization", "id": "org-001"}})
+        organizations = epi.get_entries_by_resource_type("Organization")
+        
+        self.assertEqual(len(organizations), 1)
+        self.assertEqual(organizations[0]["resource"]["id"], "org-001")
+        self.assertEqual(epi.get_composition()["id"], "comp-001")
+        
+        epi.entry[0] = {"resource": {"resourceType": "Medication", "id": "med-002"}}
+        self.assertIsNone(epi.get_composition())
+        self.assertEqual(epi.get_entries_by_resource_type("Composition"), [])
+        self.assertEqual(len(epi.get_entries_by_resource_type("Medication")), 2)
+        
+        epi.entry = None
+        self.assertIsNone(epi.get_composition())
+        self.assertEqual(epi.get_entries_by_resource_type("Medication"), [])
+    
     def test_fhir_epi_empty_entries(self):
         """Test FhirEPI with empty entries"""
         epi = FhirEPI()
@@ -102,6 +124,67 @@ class TestFhirEPI(unittest.TestCase):
         # Empty entries list should not be included
         self.assertNotIn("entry", result)
 
+    def test_fhir_epi_from_file(self):
+        """Test loading FhirEPI from a bundle JSON file"""
+        test_file = Path(__file__).parent / "testing ePIs" / "Bundle-processedbundledovato-en.json"
+        epi = FhirEPI.from_file(test_file)
+        
+        with open(test_file, 'r', encoding='utf-8') as f:
+            expected = FhirEPI.from_dict(json.load(f))
+        
+        self.assertEqual(epi.to_dict(), expected.to_dict())
+        self.assertIsNotNone(epi.get_composition())
+    
+    def test_fhir_epi_html_content_and_update_section(self):
+        """Test HTML extraction reflects update_section"""
+        epi = FhirEPI.from_dict(self.sample_bundle)
+        epi.get_composition()["section"] = [{
+            "title": "Intro",
+            "text": {"div": "<div>Old</div>"},
+            "section": [{"title": "Details", "text": {"div": "<div>Nested</div>"}}]
+        }]
+        
+        first = epi.get_all_html_content()
+        self.assertEqual(first["sections"][1]["html"], "<div>Nested</div>")
+        
+        self.assertTrue(epi.update_section("Details", "<div>New</div>"))
+        self.assertFalse(epi.update_section("Missing", "<div>New</div>"))
+        
+        updated = epi.get_all_html_content()
+        self.assertEqual(updated["sections"][1]["html"], "<div>New</div>")
+    
+    def test_fhir_epi_update_section_uses_live_sections(self):
+        """Test update_section finds sections changed after a previous extraction"""
+        epi = FhirEPI.from_dict(self.sample_bundle)
+        composition = epi.get_composition()
+        composition["section"] = [{"title": "A", "text": {"div": "<div>A</div>"}}]
+        epi.get_all_html_content()
+        
+        composition["section"][0]["section"] = [{"title": "New", "text": {"div": "<div>Old</div>"}}]
+        self.assertTrue(epi.update_section("New", "<div>New</div>"))
+        self.assertEqual(composition["section"][0]["section"][0]["text"]["div"], "<div>New</div>")
+        
+        epi.get_all_html_content()
+        composition["section"] = [{"title": "A", "text": {"div": "<div>Replaced</div>"}}]
+        self.assertTrue(epi.update_section("A", "<div>Updated</div>"))
+        self.assertEqual(composition["section"][0]["text"]["div"], "<div>Updated</div>")
+    
+    def test_fhir_epi_html_content_tracks_composition(self):
+        """Test HTML extraction follows module-level updates and composition replacement"""
+        from preprocessor.models.html_content_manager import update_html_content
+        
+        epi = FhirEPI.from_dict(self.sample_bundle)
+        first = epi.get_all_html_content()
+        first["sections"].append({"title": "Stray"})
+        self.assertEqual(epi.get_all_html_content()["sections"], [])
+        
+        self.assertTrue(update_html_content(epi.get_composition(), "<div>Changed</div>"))
+        self.assertEqual(epi.get_all_html_content()["composition_html"], "<div>Changed</div>")
+        
+        composition = epi.get_composition()
+        epi.entry[0] = {"resource": dict(composition, text={"div": "<div>Replaced</div>"})}
+        self.assertEqual(epi.get_all_html_content()["composition_html"], "<div>Replaced</div>")
+
 
 class TestPreprocessController(unittest.TestCase):
     """Test preprocess controller"""
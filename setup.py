@@ -14,7 +14,8 @@ VERSION = "1.0.0"
 REQUIRES = [
     "connexion>=2.0.2",
     "swagger-ui-bundle>=0.0.2",
-    "python_dateutil>=2.6.0"
+    "python_dateutil>=2.6.0",
+    "orjson>=3.8.0"
 ]
 
 setup(
@@ -17,10 +17,20 @@ from preprocessor.models.html_content_manager import (
     HtmlElement,
     HtmlSection,
     get_html_content,
+    get_all_html_content,
+    iter_all_html_content,
+    extract_all_html_from_sections,
+    build_section_index,
     update_html_content,
+    update_section_html,
     extract_text_content,
+    clear_html_cache,
     find_elements_by_class,
     find_elements_by_tag,
+    iter_elements_by_tag,
+    iter_elements_by_class,
+    collect_elements,
+    find_elements_soa,
     replace_html_section,
     extract_html_sections,
     wrap_content_with_element,
@@ -100,8 +110,19 @@ def test_extract_text_content():
     text = extract_text_content(html_with_entities)
     assert "&" in text
     assert "<" not in text
+    assert text == "Cost: £50 & £50"
     print("✓ HTML entity handling")
 
+    # Memoized results
+    assert extract_text_content(html_with_entities) == text
+    clear_html_cache()
+    assert extract_text_content(html_with_entities) == text
+    print("✓ Memoized extraction and cache clearing")
+
+    text = extract_text_content("<p>It&#39;s&nbsp;&lt;5&#x3e;</p>")
+    assert text == "It's <5>"
+    print("✓ Numeric entities and non-breaking spaces")
+
 
 def test_find_elements_by_class():
     """Test finding elements by class"""
@@ -148,6 +169,52 @@ def test_find_elements_by_tag():
     print(f"✓ Found {len(paras)} p element")
 
 
+def test_collect_elements():
+    """Test collecting all start tags in one pass"""
+    print("\n" + "=" * 70)
+    print("TEST: Collect Elements")
+    print("=" * 70)
+
+    html = '<div class="box wide"><p>Text</p><br/></div>'
+    elements = collect_elements(html)
+    assert [e.tag for e in elements] == ["div", "p", "br"]
+    assert elements[0].class_names == ["box", "wide"]
+    assert elements[0].position == (0, 22)
+    print(f"✓ Collected {len(elements)} elements: {elements}")
+
+    # Finders share the same scan and agree with it
+    assert [e.position for e in find_elements_by_tag(html, "p")] == [elements[1].position]
+    assert [e.position for e in find_elements_by_class(html, "wide")] == [elements[0].position]
+    print("✓ Finders agree with collected elements")
+
+    # Lazy variants
+    first_p = next(iter_elements_by_tag(html, "p"))
+    assert first_p.position == elements[1].position
+    assert next(iter_elements_by_class(html, "missing"), None) is None
+    print("✓ Lazy finders")
+
+    # Column-oriented view of the same elements
+    cols = find_elements_soa(html)
+    assert cols["tag"] == [e.tag for e in elements]
+    assert list(zip(cols["start"], cols["end"])) == [e.position for e in elements]
+    assert cols["class_names"] == [e.class_names for e in elements]
+    print("✓ Column-oriented elements")
+
+    # A stray '<' does not swallow the tag that follows it
+    assert [e.position for e in find_elements_by_tag("x<y<br/>", "br")] == [(3, 8)]
+    assert [e.tag for e in collect_elements('<y<p class="a">')] == ["p"]
+    assert get_html_structure_summary("x<y<br/>")["tag_counts"] == {"y": 1, "br": 1}
+    print("✓ Stray '<' before a tag")
+
+    # A '<' inside a quoted attribute value does not end the tag
+    quoted = '<p title="a<b" class="note">x</p>'
+    assert [e.position for e in find_elements_by_tag(quoted, "p")] == [(0, 28)]
+    assert [(e.tag, e.class_names) for e in find_elements_by_class(quoted, "note")] == [("p", ["note"])]
+    assert [e.tag for e in collect_elements(quoted)] == ["p"]
+    assert find_elements_soa(quoted)["tag"] == ["p"]
+    print("✓ Quoted attribute values containing '<'")
+
+
 def test_wrap_content_with_element():
     """Test wrapping content"""
     print("\n" + "=" * 70)
@@ -179,6 +246,13 @@ def test_wrap_content_with_element():
     assert 'data-value="123"' in result
     print("✓ Wrapping with attributes")
 
+    # Classes and attributes together, without modifying the caller's dict
+    attributes = {"id": "greeting"}
+    result = wrap_content_with_element("Hello", "p", class_names=["a", "b"], attributes=attributes)
+    assert result == '<p id="greeting" class="a b">Hello</p>'
+    assert attributes == {"id": "greeting"}
+    print("✓ Wrapping with classes and attributes")
+
 
 def test_replace_html_section():
     """Test replacing HTML sections"""
@@ -200,6 +274,15 @@ def test_replace_html_section():
     assert "old text" not in result
     print("✓ Replace between comment markers")
 
+    # End marker before the start marker
+    html = "<!-- END --> <!-- START --> text"
+    try:
+        replace_html_section(html, "<!-- START -->", "<!-- END -->", "new")
+        assert False, "Expected ValueError"
+    except ValueError as e:
+        assert "comes after" in str(e)
+    print("✓ Misordered markers rejected")
+
 
 def test_get_html_structure_summary():
     """Test HTML structure analysis"""
@@ -246,6 +329,17 @@ def test_validate_html_content():
     assert len(issues) == 0
     print("✓ Valid HTML passes validation")
 
+    # Void elements need no closing tag
+    void_html = '<div xmlns="http://www.w3.org/1999/xhtml"><img src="a.png"><col><wbr></div>'
+    is_valid, issues = validate_html_content(void_html)
+    assert is_valid, issues
+    print("✓ Void elements are not reported as unclosed")
+
+    # Unclosed element
+    is_valid, issues = validate_html_content('<div xmlns="http://www.w3.org/1999/xhtml"><p>Text</div>')
+    assert issues == ["Unclosed tag: p"]
+    print("✓ Unclosed tag detected")
+
     # Empty content
     is_valid, issues = validate_html_content("")
     assert not is_valid
@@ -259,6 +353,128 @@ def test_validate_html_content():
     print(f"✓ Validation issues: {issues}")
 
 
+def test_get_all_html_content():
+    """Test recursive extraction from nested sections"""
+    print("\n" + "=" * 70)
+    print("TEST: Get All HTML Content")
+    print("=" * 70)
+
+    composition = {
+        "resourceType": "Composition",
+        "text": {"div": "<div>Main</div>"},
+        "section": [
+            {
+                "title": "Intro",
+                "text": {"div": "<div><ul><li>One</li></ul></div>"},
+                "section": [
+                    {"title": "Details", "text": {"div": "<div><table></table></div>"}}
+                ]
+            },
+            {"title": "Outro"}
+        ]
+    }
+
+    plain = get_all_html_content(composition)
+    assert set(plain) == {"composition_html", "sections", "total_sections", "max_nesting_level"}
+    print("✓ Statistics, columns and title index are opt-in")
+
+    stats = {}
+    extract_all_html_from_sections(composition["section"], stats=stats)
+    assert stats["sections_with_lists"] == 1
+    assert stats["total_html_length"] == sum(len(s["html"]) for s in plain["sections"])
+    print("✓ Statistics into an empty dictionary")
+
+    all_html = get_all_html_content(
+        composition, include_stats=True, include_columns=True, include_index=True
+    )
+    assert all_html["sections"] == plain["sections"]
+    assert all_html["composition_html"] == "<div>Main</div>"
+    assert all_html["total_sections"] == 3
+    assert all_html["max_nesting_level"] == 1
+    assert [s["title"] for s in all_html["sections"]] == ["Intro", "Details", "Outro"]
+    assert [s["level"] for s in all_html["sections"]] == [0, 1, 0]
+    print("✓ Nested sections extracted in document order")
+
+    columns = all_html["sections_columns"]
+    assert columns["title"] == ["Intro", "Details", "Outro"]
+    assert columns["level"] == [0, 1, 0]
+    assert columns["html"][2] == ""
+    print("✓ Section columns match sections")
+
+    nested = composition["section"][0]["section"][0]
+    assert all_html["by_title"]["Details"] is nested
+    print("✓ Title index references composition sections")
+
+    stats = all_html["stats"]
+    assert stats["total_html_length"] == sum(len(h) for h in columns["html"])
+    assert stats["sections_with_lists"] == 1
+    assert stats["sections_with_tables"] == 1
+    assert stats["sections_with_links"] == 0
+    print(f"✓ Section statistics: {stats}")
+
+    composition["section"][0]["section"][0]["section"] = [{"title": "Deep"}]
+    deep = get_all_html_content(composition)
+    assert [s["level"] for s in deep["sections"]] == [0, 1, 2, 0]
+    assert deep["max_nesting_level"] == 2
+    print("✓ Levels beyond the first nesting level")
+
+    flat_composition = {
+        "section": [
+            {"title": "One", "text": {"div": "<div><a href='#'>x</a></div>"}},
+            "not a section",
+            {"title": "Two", "text": "plain"}
+        ]
+    }
+    flat = get_all_html_content(
+        flat_composition, include_stats=True, include_columns=True, include_index=True
+    )
+    assert [s["title"] for s in flat["sections"]] == ["One", "Two"]
+    assert flat["sections_columns"]["level"] == [0, 0]
+    assert flat["sections_columns"]["html"][1] == ""
+    assert flat["by_title"]["Two"] is flat_composition["section"][2]
+    assert flat["stats"]["sections_with_links"] == 1
+    assert flat["max_nesting_level"] == 0
+    print("✓ Flat sections without subsections")
+
+    lazy = iter_all_html_content(composition)
+    first = next(lazy)
+    assert first["title"] == "Intro"
+    assert first["html"] is composition["section"][0]["text"]["div"]
+    assert [first] + list(lazy) == deep["sections"]
+    assert list(iter_all_html_content({})) == []
+    print("✓ Lazy section iteration shares the composition HTML")
+
+    empty = get_all_html_content({}, include_index=True)
+    assert empty["total_sections"] == 0
+    assert empty["by_title"] == {}
+    print("✓ Empty composition")
+
+
+def test_update_section_html():
+    """Test updating nested section HTML by title"""
+    print("\n" + "=" * 70)
+    print("TEST: Update Section HTML")
+    print("=" * 70)
+
+    sections = [
+        {"title": "Intro", "section": [{"title": "Dose"}, {"title": "Storage"}]},
+        {"title": "Dose", "text": {"div": "<div>Later duplicate</div>"}}
+    ]
+
+    assert update_section_html(sections, "Storage", "<div>Dry</div>")
+    assert sections[0]["section"][1]["text"]["div"] == "<div>Dry</div>"
+    assert not update_section_html(sections, "Storage", "<div>X</div>", recursive=False)
+    assert not update_section_html(sections, "Missing", "<div>X</div>")
+    print("✓ Recursive search and non-recursive lookup")
+
+    index = build_section_index(sections)
+    assert index["Dose"] is sections[0]["section"][0]
+    assert update_section_html(sections, "Dose", "<div>First</div>", section_index=index)
+    assert sections[0]["section"][0]["text"]["div"] == "<div>First</div>"
+    assert sections[1]["text"]["div"] == "<div>Later duplicate</div>"
+    print("✓ Indexed update targets the first matching section")
+
+
 def test_real_epis_html_extraction():
     """Test HTML extraction from real ePIs"""
     print("\n" + "=" * 70)
@@ -361,11 +577,14 @@ def main():
         test_extract_text_content,
         test_find_elements_by_class,
         test_find_elements_by_tag,
+        test_collect_elements,
         test_wrap_content_with_element,
         test_replace_html_section,
         test_get_html_structure_summary,
         test_validate_html_content,
         test_html_content_modification_workflow,
+        test_get_all_html_content,
+        test_update_section_html,
         test_real_epis_html_extraction,
     ]
 